@@ -1,5 +1,26 @@
 import os
 import configparser
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _load_config(config_path, mtime):
+    """
+    Parse the INI file at config_path, cached per (path, mtime).
+
+    The mtime key invalidates the cache whenever the file changes on disk.
+
+    Args:
+        config_path (str): Path to the configuration file.
+        mtime (float): Last modification time of the file.
+
+    Returns:
+        tuple[ConfigParser, list[str]]: Parsed configuration and list of files read.
+    """
+
+    config = configparser.ConfigParser(interpolation=None)
+    readable_file = config.read(config_path)
+    return config, readable_file
 
 
 class Config(object):
@@ -54,8 +75,7 @@ class Config(object):
 
         try:
             self.validate_config_path()
-            config = configparser.ConfigParser(interpolation=None)
-            file_reader = config.read(self.config_path)
+            config, file_reader = _load_config(self.config_path, os.path.getmtime(self.config_path))
             self.validate_file_readability(file_reader)
             self.validate_file_integrity(config)
             return config
@@ -1,10 +1,16 @@
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import sessionmaker
 from sqlalchemy_dbtoolkit.engine.factory import AlchemyEngineFactory
 from sqlalchemy_dbtoolkit.orm.base import ORMBaseManager
 from sqlalchemy_dbtoolkit.query.create import InsertManager
-from sqlalchemy_dbtoolkit.query.read import SelectManager
 from sqlalchemy_dbtoolkit.utils.sanitization import sanitize_nan_to_none
 from distance_matrix.database_models import Location, Distance
 
+BULK_INSERT_CHUNK_SIZE = 10000
+
 
 class DatabaseOperations:
     """
@@ -23,8 +29,10 @@ class DatabaseOperations:
         self.db_name = db_name
         self.dbms = dbms
         self.engine = self.get_engine()
+        self.SessionFactory = sessionmaker(self.engine, expire_on_commit=False)
 
         self.TableManager = ORMBaseManager(self.engine)
+        self.InsertQuery = InsertManager(self.engine)
 
         self.Distance = Distance
         self.Location = Location
@@ -42,7 +50,12 @@ class DatabaseOperations:
 
         try:
             DBEngine = AlchemyEngineFactory(dbms=self.dbms, db_name=self.db_name, config_path='../.config/config.ini')
-            return DBEngine.engine
+
+            pool_kwargs = {'pool_pre_ping': True}
+            if self.dbms != 'sqlite':
+                pool_kwargs.update(pool_size=10, max_overflow=20)
+
+            return create_engine(DBEngine.engine.url, **pool_kwargs)
         except Exception as e:
             raise ConnectionError(f"Failed to create SQLAlchemy engine: {e}")
 
@@ -62,21 +75,81 @@ class DatabaseOperations:
         """
 
         try:
-            select_query = SelectManager(self.engine)
-            origin = select_query.select_one_by_column(self.Location, "location_name", origin_name)
-            destination = select_query.select_one_by_column(self.Location, "location_name", destination_name)
+            with self.SessionFactory() as session:
+                result = session.execute(select(self.Location.location_name, self.Location.id)
+                                         .where(self.Location.location_name.in_([origin_name, destination_name])))
+                location_ids = dict(result.all())
 
-            insert_query = InsertManager(self.engine)
-            data = {"origin_id": origin.id,
-                    "destination_id": destination.id,
+            data = {"origin_id": location_ids[origin_name],
+                    "destination_id": location_ids[destination_name],
                     "distance_km": sanitize_nan_to_none(distance_km),
                     "duration_sec": sanitize_nan_to_none(duration_sec),
                     "timestamp_utc": timestamp_utc}
-            insert_query.add_row(self.Distance, data)
+            self.InsertQuery.add_row(self.Distance, data)
 
         except Exception as e:
             raise ValueError(f"Failed to insert distance data: {e}")
 
+    def get_location_id_map(self):
+        """
+        Fetch all locations once and map their names to primary keys.
+
+        Returns:
+            dict[str, int]: Mapping of location_name to 'locations' primary key.
+
+        Raises:
+            ValueError: If the lookup fails.
+        """
+
+        try:
+            with self.SessionFactory() as session:
+                result = session.execute(select(self.Location.location_name, self.Location.id))
+                return dict(result.all())
+        except Exception as e:
+            raise ValueError(f"Failed to fetch location id map: {e}")
+
+    def bulk_insert_distances(self, rows):
+        """
+        Insert multiple rows into the 'distances' table with a single bulk statement.
+
+        Args:
+            rows (list[dict]): Row dictionaries with keys 'origin_id', 'destination_id',
+                               'distance_km', 'duration_sec' and 'timestamp_utc'.
+
+        Raises:
+            ValueError: If insertion fails.
+        """
+
+        if not rows:
+            return
+
+        try:
+            sanitized_rows = [{**row,
+                               "distance_km": sanitize_nan_to_none(row["distance_km"]),
+                               "duration_sec": sanitize_nan_to_none(row["duration_sec"])}
+                              for row in rows]
+
+            self.execute_chunked(insert(self.Distance), sanitized_rows)
+        except Exception as e:
+            raise ValueError(f"Failed to bulk insert distance data: {e}")
+
+    def execute_chunked(self, statement, rows, chunk_size=BULK_INSERT_CHUNK_SIZE):
+        """
+        Execute a statement over all rows in chunks within a single transaction.
+
+        Opens one connection and commits once, so large batches avoid
+        per-row transaction overhead.
+
+        Args:
+            statement: SQLAlchemy insert statement to execute.
+            rows (list[dict]): Parameter dictionaries, one per row.
+            chunk_size (int): Maximum number of rows per executemany call.
+        """
+
+        with self.engine.begin() as connection:
+            for start in range(0, len(rows), chunk_size):
+                connection.execute(statement, rows[start:start + chunk_size])
+
     def insert_data_in_location_table(self, location_name, location_address):
         """
         Insert a single row into the 'locations' table.
@@ -90,13 +163,45 @@ class DatabaseOperations:
         """
 
         try:
-            insert_query = InsertManager(self.engine)
             data = {"location_name": location_name,
                     "location_address": location_address}
-            insert_query.add_row(self.Location, data)
+            self.InsertQuery.add_row(self.Location, data)
         except Exception as e:
             raise ValueError(f"Failed to insert location data: {e}")
 
+    def bulk_upsert_locations(self, rows):
+        """
+        Insert multiple rows into the 'locations' table, skipping existing names.
+
+        Uses a dialect-aware single statement: ON CONFLICT DO NOTHING for
+        SQLite/PostgreSQL and INSERT IGNORE for MySQL.
+
+        Args:
+            rows (list[dict]): Row dictionaries with keys 'location_name' and 'location_address'.
+
+        Raises:
+            ValueError: If insertion fails.
+        """
+
+        if not rows:
+            return
+
+        try:
+            dialect = self.engine.dialect.name
+
+            if dialect == 'sqlite':
+                statement = sqlite_insert(self.Location).on_conflict_do_nothing(index_elements=['location_name'])
+            elif dialect == 'postgresql':
+                statement = postgresql_insert(self.Location).on_conflict_do_nothing(index_elements=['location_name'])
+            elif dialect == 'mysql':
+                statement = mysql_insert(self.Location).prefix_with('IGNORE')
+            else:
+                raise ValueError(f"Unsupported dialect for location upsert: {dialect}")
+
+            self.execute_chunked(statement, rows)
+        except Exception as e:
+            raise ValueError(f"Failed to bulk upsert location data: {e}")
+
     def create_tables_if_not_exists(self):
         """
         Create database tables if they do not already exist.
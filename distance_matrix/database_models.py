@@ -1,12 +1,12 @@
 from sqlalchemy_dbtoolkit.orm.base import Base
-from sqlalchemy import Column, Integer, String, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Integer, String, TIMESTAMP, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 
 class Location(Base):
     __tablename__ = 'locations'
     id = Column(Integer, primary_key=True)
-    location_name = Column(String(length=255), nullable=False, unique=True)
+    location_name = Column(String(length=255), nullable=False, unique=True, index=True)
     location_address = Column(String(length=255), nullable=False)
 
     origins = relationship("Distance", back_populates="origin", foreign_keys='Distance.origin_id')
@@ -15,6 +15,7 @@ class Location(Base):
 
 class Distance(Base):
     __tablename__ = 'distances'
+    __table_args__ = (Index('ix_origin_destination', 'origin_id', 'destination_id'),)
     id = Column(Integer, primary_key=True)
     origin_id = Column(Integer, ForeignKey('locations.id'), nullable=False)
     destination_id = Column(Integer, ForeignKey('locations.id'), nullable=False)
@@ -4,9 +4,18 @@ import os
 import re
 import hashlib
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from datetime import datetime, timezone
 from distance_matrix.config import Config
-from distance_matrix.payload_validation import prepare_distance_matrix_api_payload, convert_data_to_list
+from distance_matrix.payload_validation import prepare_distance_matrix_api_payload, convert_data_to_list, \
+    validate_payload_options
+
+NON_WORD_PATTERN = re.compile(r'\W+')
 
 
 class GoogleMapsFetcher:
@@ -23,7 +32,9 @@ class GoogleMapsFetcher:
             destinations_query (str|list|tuple): Destination location(s).
         """
 
-        self.api_payload = prepare_distance_matrix_api_payload(origins_query, destinations_query)
+        # Kept as a plain dict so callers can tweak payload options by key
+        # before running the pipeline (see the custom pipeline example in the README).
+        self.api_payload = prepare_distance_matrix_api_payload(origins_query, destinations_query)._asdict()
         self.search_query = convert_data_to_list(origins_query) + convert_data_to_list(destinations_query)
 
         self.client = googlemaps.Client(key=Config().api_key)
@@ -49,6 +60,48 @@ class GoogleMapsFetcher:
         except Exception as e:
             raise ValueError(f"Error fetching distance matrix: {e}")
 
+    def fetch_distance_matrix_chunks(self, chunk_payloads, max_workers=8):
+        """
+        Fetch multiple Distance Matrix API requests in parallel and merge them.
+
+        Intended for grids that exceed the per-request element limit and are
+        split into several payloads over the same destinations. The requests
+        are I/O-bound, so they are overlapped with a thread pool. Chunks are
+        merged in payload order by concatenating origins and rows.
+
+        Args:
+            chunk_payloads (list[DMPayload|dict]): Prepared API payloads, one per origin chunk.
+            max_workers (int): Maximum number of parallel requests.
+
+        Raises:
+            ValueError: If any chunk request fails or destinations differ between chunks.
+        """
+
+        try:
+            payload_dicts = [payload._asdict() if hasattr(payload, "_asdict") else payload
+                             for payload in chunk_payloads]
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(executor.map(lambda payload: self.client.distance_matrix(**payload), payload_dicts))
+
+            merged_response = {"status": "OK", "origin_addresses": [], "destination_addresses": [], "rows": []}
+
+            for response in responses:
+                if response.get("status") != "OK":
+                    raise ValueError(f"Failed to fetch data: {response['status']}")
+                if not merged_response["destination_addresses"]:
+                    merged_response["destination_addresses"] = response["destination_addresses"]
+                elif response["destination_addresses"] != merged_response["destination_addresses"]:
+                    raise ValueError("Chunk responses have mismatching destination addresses")
+
+                merged_response["origin_addresses"] += response["origin_addresses"]
+                merged_response["rows"] += response["rows"]
+
+            self.api_response = merged_response
+            self.build_filename_from_query("dist_matrix_data")
+        except Exception as e:
+            raise ValueError(f"Error fetching distance matrix chunks: {e}")
+
     def append_request_timestamp(self):
         """
         Add UTC ISO timestamp to the API response.
@@ -64,7 +117,12 @@ class GoogleMapsFetcher:
             ValueError: If any step in the pipeline fails.
         """
         try:
-            prepare_distance_matrix_api_payload(**self.api_payload)  # Revalidate config before API call
+            # Revalidate options before the API call, since callers may have
+            # modified api_payload after construction.
+            payload_options = {key: value for key, value in self.api_payload.items()
+                               if key not in ("origins", "destinations")}
+            validate_payload_options(**payload_options)
+
             self.fetch_distance_matrix()
             self.append_request_timestamp()
             self.archive_api_response()
@@ -84,14 +142,16 @@ class GoogleMapsFetcher:
             str: Sanitized string.
         """
 
-        clean_query = unicodedata.normalize('NFKD', str(search_query)).encode('ascii', 'ignore').decode('ascii')
-        clean_query = re.sub(r'\W+', '', clean_query)
+        clean_query = str(search_query)
+        if not clean_query.isascii():
+            clean_query = unicodedata.normalize('NFKD', clean_query).encode('ascii', 'ignore').decode('ascii')
+        clean_query = NON_WORD_PATTERN.sub('', clean_query)
         clean_query = clean_query[:max_length]
         return clean_query
 
     def generate_hash_code(self, data, max_length=7):
         """
-        Generate short MD5 hash from string.
+        Generate short BLAKE2b hash from string.
 
         Args:
             data (str): Input to hash.
@@ -101,7 +161,7 @@ class GoogleMapsFetcher:
             str: Truncated hash string.
         """
 
-        hash_code = hashlib.md5(data.encode()).hexdigest()[:max_length]
+        hash_code = hashlib.blake2b(data.encode(), digest_size=8).hexdigest()[:max_length]
         return hash_code
 
     def build_filename_from_query(self, label):
@@ -141,8 +201,12 @@ class GoogleMapsFetcher:
             if not self.api_response:
                 raise ValueError("No valid API response to archive.")
 
-            with open(filepath, 'w') as file:
-                json.dump(self.api_response, file, indent=4)
+            if orjson is not None:
+                with open(filepath, 'wb') as file:
+                    file.write(orjson.dumps(self.api_response, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w') as file:
+                    json.dump(self.api_response, file, indent=4)
             print(f"Saved API response to {filepath}")
         except Exception as e:
             raise ValueError(f"Failed to archive api response: {e}")
@@ -4,6 +4,11 @@ import os
 import json
 from distance_matrix.database_handler import DatabaseOperations
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class DistanceMatrixGenerator:
     """
@@ -57,10 +62,15 @@ class DistanceMatrixGenerator:
         try:
             filepath = f"../data/raw/{self.filename}.json"
 
-            with open(filepath, "r") as file:
-                self.raw_api_response = json.load(file)
-                self.origin_addresses = self.raw_api_response['origin_addresses']  # used as rows
-                self.destination_addresses = self.raw_api_response['destination_addresses']  # used as columns
+            if orjson is not None:
+                with open(filepath, "rb") as file:
+                    self.raw_api_response = orjson.loads(file.read())
+            else:
+                with open(filepath, "r") as file:
+                    self.raw_api_response = json.load(file)
+
+            self.origin_addresses = self.raw_api_response['origin_addresses']  # used as rows
+            self.destination_addresses = self.raw_api_response['destination_addresses']  # used as columns
         except Exception as e:
             raise ValueError(f"Failed to load fetched data: {e}")
 
@@ -94,11 +104,9 @@ class DistanceMatrixGenerator:
             addresses (list[str]): Corresponding list of location addresses.
         """
 
-        for name, address in zip(names, addresses):
-            try:
-                self.DB_Ops.insert_data_in_location_table(name, address)
-            except Exception as e:
-                print(f"WARNING: {name} already in locations table: {e}")
+        rows = [{"location_name": name, "location_address": address}
+                for name, address in zip(names, addresses)]
+        self.DB_Ops.bulk_upsert_locations(rows)
 
     def build_matrix(self):
         """
@@ -115,80 +123,73 @@ class DistanceMatrixGenerator:
 
         try:
             self.validate_api_response()
-            self.distance_matrix_df = pd.DataFrame(data=self.origin_names, columns=["Matrix"])
-            self.distance_matrix_df.set_index("Matrix", inplace=True)
 
+            location_id_map = None
             if self.write_to_db:
                 self.insert_locations_if_not_exists(self.origin_names, self.origin_addresses)
                 self.insert_locations_if_not_exists(self.destination_names, self.destination_addresses)
+                location_id_map = self.DB_Ops.get_location_id_map()
 
             timestamp_utc = self.raw_api_response["request_time_iso"]
+            distance_rows = []
+
+            matrix_shape = (len(self.origin_addresses), len(self.destination_addresses))
+            distance_array = np.full(matrix_shape, np.nan)
+            duration_array = np.full(matrix_shape, np.nan)
 
-            for column, column_name in enumerate(self.destination_addresses):
-                for row, row_name in enumerate(self.origin_addresses):
+            response_rows = self.raw_api_response['rows']
+            origin_names = self.origin_names
+            destination_names = self.destination_names
+            write_to_db = self.write_to_db
+            extract_distance_duration = self.extract_distance_duration
 
-                    element_data = self.raw_api_response['rows'][row]['elements'][column]
-                    distance_data = self.extract_travel_attribute(element_data, 'distance')
-                    # print(f"Direction from '{row_name}' to '{column_name}' is: {distance_data}")
+            for row, row_data in enumerate(response_rows):
+                row_alias = origin_names[row]
 
-                    row_alias = self.origin_names[row]
-                    column_alias = self.destination_names[column]
-                    self.distance_matrix_df.loc[row_alias, column_alias] = distance_data
+                for column, element_data in enumerate(row_data['elements']):
+                    distance_data, duration_data = extract_distance_duration(element_data)
 
-                    duration_data = self.extract_travel_attribute(element_data, 'duration')
-                    # print(f"Duration from '{row_name}' to '{column_name}' is: {duration_data}")
+                    distance_array[row, column] = distance_data
+                    duration_array[row, column] = duration_data
 
-                    if self.write_to_db:
-                        self.DB_Ops.insert_data_in_distance_table(origin_name=row_alias,
-                                                                  destination_name=column_alias,
-                                                                  distance_km=distance_data,
-                                                                  duration_sec=duration_data,
-                                                                  timestamp_utc=timestamp_utc)
+                    if write_to_db:
+                        distance_rows.append({"origin_id": location_id_map[row_alias],
+                                              "destination_id": location_id_map[destination_names[column]],
+                                              "distance_km": distance_data,
+                                              "duration_sec": duration_data,
+                                              "timestamp_utc": timestamp_utc})
+
+            self.distance_matrix_df = pd.DataFrame(distance_array,
+                                                   index=pd.Index(self.origin_names, name="Matrix"),
+                                                   columns=self.destination_names)
+
+            if self.write_to_db:
+                self.DB_Ops.bulk_insert_distances(distance_rows)
 
             self.export_matrix_as_csv(self.distance_matrix_df)
 
         except Exception as e:
             raise ValueError(f"Failed to generate distance matrix: {e}")
 
-    def extract_travel_attribute(self, element_data, attribute):
+    def extract_distance_duration(self, element_data):
         """
-        Extracts a travel attribute from a single API response element.
+        Extracts distance and duration from a single API response element.
 
-        Converts distances to kilometers and durations to seconds. Returns NaN for missing or failed results.
+        Checks the element status once, converts the distance to kilometers
+        and keeps the duration in seconds. Returns NaN for failed results.
 
         Args:
             element_data (dict): The 'element' block from the API response.
-            attribute (str): Either "distance" or "duration".
 
         Returns:
-            int | float: Value of the specified attribute, or np.nan if unavailable.
-
-        Raises:
-            ValueError: If an unsupported attribute is requested.
+            tuple[int | float, int | float]: (distance_km, duration_sec), or NaN values if unavailable.
         """
 
-        request_status = element_data['status']
-
-        if request_status == 'OK':
-            if attribute not in ("distance", "duration"):
-                raise ValueError(f"Unsupported data method: {attribute}")
-
-            result = element_data[attribute]['value']
-            if attribute == 'distance':
-                km_result = int(round((result / 1000), ndigits=0))
-                return km_result
-            elif attribute == 'duration':
-                return result
-
-        elif request_status == "ZERO_RESULTS":
-            # print(f"Direction calculation is not possible see status: {request_status}")
-            return np.nan
-        elif request_status == "NOT_FOUND":
-            # print(f"Origin or destination not found see status: {request_status}")
-            return np.nan
-        else:
-            # print(f"Error for origin or destination see status: {request_status}")
-            return np.nan
+        if element_data['status'] == 'OK':
+            distance_km = int(round(element_data['distance']['value'] / 1000, ndigits=0))
+            duration_sec = element_data['duration']['value']
+            return distance_km, duration_sec
+        return np.nan, np.nan
 
     def sanitize_labels(self, labels):
         """
@@ -202,16 +203,8 @@ class DistanceMatrixGenerator:
             list[str]: Sanitized list of label strings.
         """
 
-        sanitized_labels = labels.copy()
-
-        for index, label in enumerate(sanitized_labels):
-            if not isinstance(label, str):
-                label = "Unknown"
-            clean_label = label.strip().lower().title()
-            if not bool(clean_label.strip()):
-                clean_label = "Unknown"
-            sanitized_labels[index] = clean_label
-        return sanitized_labels
+        return [label.strip().lower().title() if isinstance(label, str) and label.strip() else "Unknown"
+                for label in labels]
 
     def export_matrix_as_csv(self, matrix, directory='../data/processed/'):
         """
@@ -227,7 +220,7 @@ class DistanceMatrixGenerator:
 
         try:
             export_path = os.path.join(directory, f"{self.filename}.csv")
-            matrix.to_csv(export_path, na_rep="NaN")
+            matrix.to_csv(export_path, na_rep="NaN", chunksize=100000)
             print(f"Data Frame has been written to {export_path}")
         except Exception as e:
             raise ValueError(f"Failed to export distance matrix csv: {e}")
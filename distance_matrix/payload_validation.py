@@ -1,5 +1,36 @@
 import time
 import datetime
+import logging
+from collections import namedtuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+VALID_MODES = frozenset({None, "driving", "walking", "bicycling", "transit"})
+VALID_AVOIDS = frozenset({None, "tolls", "highways", "ferries"})
+VALID_UNITS = frozenset({None, "metric", "imperial"})
+VALID_TRANSIT_MODES = frozenset({None, "bus", "subway", "train", "tram", "rail"})
+VALID_TRANSIT_ROUTING_PREFERENCES = frozenset({None, "less_walking", "fewer_transfers"})
+VALID_TRAFFIC_MODELS = frozenset({None, "best_guess", "optimistic", "pessimistic"})
+
+NUMERIC_TYPES = (int, float)
+
+TIME_BUFFER_SECONDS = 240
+TIME_BUFFER_TIMEDELTA = datetime.timedelta(seconds=TIME_BUFFER_SECONDS)
+
+_MISSING = object()
+
+# Lightweight immutable payload container; use _asdict() at the boundary
+# where the googlemaps client expects keyword arguments.
+DMPayload = namedtuple("DMPayload", ["origins", "destinations", "mode", "language", "avoid", "units",
+                                     "departure_time", "arrival_time", "transit_mode",
+                                     "transit_routing_preference", "traffic_model", "region"],
+                       defaults=(None,) * 10)
 
 
 def prepare_distance_matrix_api_payload(origins, destinations, mode=None, language=None, avoid=None, units=None,
@@ -24,66 +55,120 @@ def prepare_distance_matrix_api_payload(origins, destinations, mode=None, langua
         region (str): Region biasing.
 
     Returns:
-        dict: Validated and formatted config dictionary for API request.
+        DMPayload: Validated and formatted payload for the API request.
 
     Raises:
         ValueError: If any parameter is invalid.
     """
 
-    valid_modes = [None, "driving", "walking", "bicycling", "transit"]
-    valid_avoids = [None, "tolls", "highways", "ferries"]
-    valid_units = [None, "metric", "imperial"]
-    valid_transit_modes = [None, "bus", "subway", "train", "tram", "rail"]
-    valid_transit_routing_preferences = [None, "less_walking", "fewer_transfers"]
-    valid_traffic_model = [None, "best_guess", "optimistic", "pessimistic"]
-
     if not is_valid_distance_matrix_query(origins):
         raise ValueError(f"Invalid origins: {origins}")
 
     if not is_valid_distance_matrix_query(destinations):
         raise ValueError(f"Invalid destinations: {destinations}")
 
-    if mode not in valid_modes:
+    validate_payload_options(mode=mode, avoid=avoid, units=units,
+                             departure_time=departure_time, arrival_time=arrival_time,
+                             transit_mode=transit_mode,
+                             transit_routing_preference=transit_routing_preference,
+                             traffic_model=traffic_model)
+
+    request_payload = DMPayload(origins=origins,
+                                destinations=destinations,
+                                mode=mode,
+                                language=language,
+                                avoid=avoid,
+                                units=units,
+                                departure_time=departure_time,
+                                arrival_time=arrival_time,
+                                transit_mode=transit_mode,
+                                transit_routing_preference=transit_routing_preference,
+                                traffic_model=traffic_model,
+                                region=region)
+
+    return request_payload
+
+
+def validate_payload_options(mode=None, language=None, avoid=None, units=None, departure_time=None,
+                             arrival_time=None, transit_mode=None, transit_routing_preference=None,
+                             traffic_model=None, region=None):
+    """
+    Validate the optional Distance Matrix API parameters.
+
+    Shared by prepare_distance_matrix_api_payload and make_payload_builder.
+    language and region accept any value and are listed only so every
+    optional payload parameter can be passed through.
+
+    Raises:
+        ValueError: If any parameter is invalid.
+    """
+
+    if mode not in VALID_MODES:
         raise ValueError(f"Invalid travel mode selection: {mode}")
 
-    if avoid not in valid_avoids:
+    if avoid not in VALID_AVOIDS:
         raise ValueError(f"Invalid avoid selection: {avoid}")
 
-    if units not in valid_units:
+    if units not in VALID_UNITS:
         raise ValueError(f"Invalid units selection: {units}")
 
-    if departure_time and arrival_time:
+    if departure_time is not None and arrival_time is not None:
         raise ValueError("Should not specify both departure_time and arrival_time.")
-    else:
-        if not is_valid_travel_time(departure_time):
-            raise ValueError(f"Invalid departure_time: {departure_time}")
-        elif not is_valid_travel_time(arrival_time):
-            raise ValueError(f"Invalid arrival_time: {arrival_time}")
 
-    if transit_mode not in valid_transit_modes:
+    if departure_time is not None and not is_valid_travel_time(departure_time):
+        raise ValueError(f"Invalid departure_time: {departure_time}")
+
+    if arrival_time is not None and not is_valid_travel_time(arrival_time):
+        raise ValueError(f"Invalid arrival_time: {arrival_time}")
+
+    if transit_mode not in VALID_TRANSIT_MODES:
         raise ValueError(f"Invalid transit mode selection: {transit_mode}")
 
-    if transit_routing_preference not in valid_transit_routing_preferences:
+    if transit_routing_preference not in VALID_TRANSIT_ROUTING_PREFERENCES:
         raise ValueError(f"Invalid transit routing preference: {transit_routing_preference}")
 
-    if traffic_model not in valid_traffic_model:
+    if traffic_model not in VALID_TRAFFIC_MODELS:
         raise ValueError(f"Invalid traffic model selection: {traffic_model}")
 
-    request_payload = {"origins": origins,
-                     "destinations": destinations,
-                     "mode": mode,
-                     "language": language,
-                     "avoid": avoid,
-                     "units": units,
-                     "departure_time": departure_time,
-                     "arrival_time": arrival_time,
-                     "transit_mode": transit_mode,
-                     "transit_routing_preference": transit_routing_preference,
-                     "traffic_model": traffic_model,
-                     "region": region
-                     }
 
-    return request_payload
+PAYLOAD_OPTION_DEFAULTS = dict(mode=None, language=None, avoid=None, units=None, departure_time=None,
+                               arrival_time=None, transit_mode=None, transit_routing_preference=None,
+                               traffic_model=None, region=None)
+
+
+def make_payload_builder(**fixed_kwargs):
+    """
+    Pre-validate fixed payload parameters and return a fast payload builder.
+
+    Callers that build many payloads with the same options (e.g. always
+    mode='driving', units='metric') validate those options once here; the
+    returned builder then assembles payloads without re-running the
+    validation ladder on every call. Origins and destinations are taken as
+    given, so pre-validate them when they come from untrusted input.
+
+    Args:
+        **fixed_kwargs: Any prepare_distance_matrix_api_payload parameters
+                        other than origins and destinations.
+
+    Returns:
+        Callable: build_payload(origins, destinations, **overrides) -> DMPayload.
+                  Overrides are validated together with the fixed options.
+
+    Raises:
+        ValueError: If any fixed parameter is invalid.
+    """
+
+    validate_payload_options(**fixed_kwargs)
+    base_payload = {**PAYLOAD_OPTION_DEFAULTS, **fixed_kwargs}
+
+    def build_payload(origins, destinations, **overrides):
+        if overrides:
+            validate_payload_options(**{**fixed_kwargs, **overrides})
+            return DMPayload(origins=origins, destinations=destinations, **{**base_payload, **overrides})
+
+        return DMPayload(origins=origins, destinations=destinations, **base_payload)
+
+    return build_payload
 
 
 def is_valid_travel_time(travel_time):
@@ -97,24 +182,31 @@ def is_valid_travel_time(travel_time):
         bool: True if valid, False otherwise.
     """
 
-    current_datetime = datetime.datetime.now()
-    current_time = time.time()
-    time_buffer_min = 4
+    if travel_time is None:
+        return True
 
-    if isinstance(travel_time, str) and travel_time != "now":
-        print(f"Invalid {type(travel_time)} - '{travel_time}' should be 'now' when string")
-        return False
+    if isinstance(travel_time, str):
+        if travel_time != "now":
+            logger.debug("Invalid %s - '%s' should be 'now' when string", type(travel_time), travel_time)
+            return False
+        return True
 
-    elif isinstance(travel_time, datetime.datetime) and travel_time < (current_datetime - datetime.timedelta(minutes=time_buffer_min)):
-        print(f"Invalid time {travel_time}, must be in future. Current time: {current_datetime} ")
-        return False
+    if isinstance(travel_time, datetime.datetime):
+        current_datetime = datetime.datetime.now()
+        if travel_time < (current_datetime - TIME_BUFFER_TIMEDELTA):
+            logger.debug("Invalid time %s, must be in future. Current time: %s", travel_time, current_datetime)
+            return False
+        return True
 
-    elif isinstance(travel_time, (int, float)) and travel_time < (current_time - (time_buffer_min*60)):
-        print(f"Invalid time {travel_time}, must be in future. Current time: {current_time} ")
-        return False
-    else:
+    if isinstance(travel_time, NUMERIC_TYPES):
+        current_time = time.time()
+        if travel_time < (current_time - TIME_BUFFER_SECONDS):
+            logger.debug("Invalid time %s, must be in future. Current time: %s", travel_time, current_time)
+            return False
         return True
 
+    return True
+
 
 def is_valid_coordinate_dict(coordinate_dict):
     """
@@ -127,35 +219,63 @@ def is_valid_coordinate_dict(coordinate_dict):
         bool: True if valid coordinate dictionary, False otherwise.
     """
 
-    valid_keys = ["lat", "lng"]
-    if all(key in coordinate_dict for key in valid_keys):
-        for key in valid_keys:
-            if not is_valid_coordinate_pair([coordinate_dict[key]]):
-                print(f"Wrong type for {key}: {coordinate_dict[key]} is {type(coordinate_dict[key]).__name__}")
-                return False
-        return True
-    else:
-        print(f"Missing one or more from valid keys ({valid_keys}) in dict: {coordinate_dict.keys()}")
+    lat = coordinate_dict.get("lat", _MISSING)
+    lng = coordinate_dict.get("lng", _MISSING)
+
+    if lat is _MISSING or lng is _MISSING:
+        logger.debug("Missing one or more from valid keys (['lat', 'lng']) in dict: %s", coordinate_dict.keys())
         return False
 
+    lat = convert_str_to_float(lat)
+    lng = convert_str_to_float(lng)
+
+    for key, value in (("lat", lat), ("lng", lng)):
+        if not isinstance(value, NUMERIC_TYPES):
+            logger.debug("Wrong type for %s: %s is %s", key, value, type(value).__name__)
+            return False
+    return is_valid_coordinate_range(lat, lng)
+
 
 def is_valid_coordinate_pair(coordinate_pair):
     """
-    Check if coordinate pair contains numeric values.
+    Check if coordinate pair contains numeric values within valid ranges.
 
     Args:
         coordinate_pair (list|tuple): Must contain exactly two numeric values - Latitude and longitude.
 
     Returns:
-        bool: True if all values are float or int, False otherwise.
+        bool: True if both values are float or int and in range, False otherwise.
     """
 
-    for coordinate in coordinate_pair:
-        coordinate = convert_str_to_float(coordinate)
-        if not isinstance(coordinate, (int, float)):
-            print(f"Wrong type for {coordinate}: {type(coordinate).__name__}")
+    lat = convert_str_to_float(coordinate_pair[0])
+    lng = convert_str_to_float(coordinate_pair[1])
+
+    for coordinate in (lat, lng):
+        if not isinstance(coordinate, NUMERIC_TYPES):
+            logger.debug("Wrong type for %s: %s", coordinate, type(coordinate).__name__)
             return False
-    return True
+    return is_valid_coordinate_range(lat, lng)
+
+
+def is_valid_coordinate_range(lat, lng):
+    """
+    Check that latitude and longitude fall within their valid ranges.
+
+    Keeps the scalar validators consistent with the batched
+    validate_coordinate_array fast path.
+
+    Args:
+        lat (int|float): Latitude, valid within [-90, 90].
+        lng (int|float): Longitude, valid within [-180, 180].
+
+    Returns:
+        bool: True if both values are in range, False otherwise.
+    """
+
+    if -90.0 <= lat <= 90.0 and -180.0 <= lng <= 180.0:
+        return True
+    logger.debug("Coordinate out of range: lat %s must be in [-90, 90], lng %s in [-180, 180]", lat, lng)
+    return False
 
 
 def convert_str_to_float(value):
@@ -169,19 +289,68 @@ def convert_str_to_float(value):
     Returns:
         any: The converted float if conversion is successful; otherwise, the original value.
     """
+    if not isinstance(value, str):
+        return value
+
     try:
-        if isinstance(value, str):
-            value = float(value)
+        return float(value)
     except ValueError:
-        print(f"Could not convert {value} to float: {type(value).__name__}")
-    finally:
+        logger.debug("Could not convert %s to float: %s", value, type(value).__name__)
         return value
 
 
+def _validate_str_entry(data):
+    """
+    Validate a single string location entry.
+
+    Args:
+        data (str): Single data entry.
+
+    Returns:
+        bool: True if entry is valid, False otherwise.
+    """
+
+    if not data or data.isspace():  # returns False when string is empty or just consist of empty data
+        return False
+
+    if data.startswith("ChI"):
+        logger.debug("Wrongly formatted PlaceID for %s. Each Place ID string must be prepended with 'place_id:'", data)
+        return False
+
+    return True
+
+
+def _validate_seq_entry(data):
+    """
+    Validate a single list or tuple location entry as a coordinate pair.
+
+    Args:
+        data (list|tuple): Single data entry.
+
+    Returns:
+        bool: True if entry is valid, False otherwise.
+    """
+
+    if len(data) == 2 and is_valid_coordinate_pair(data):
+        return True
+    else:
+        logger.debug("Input %s is not a valid coordinate pair", data)
+        return False
+
+
+_ENTRY_VALIDATORS = {str: _validate_str_entry,
+                     dict: is_valid_coordinate_dict,
+                     list: _validate_seq_entry,
+                     tuple: _validate_seq_entry}
+
+
 def is_valid_data_entry(data):
     """
     Validate an individual location data entry.
 
+    Dispatches on the exact entry type for the common cases and falls back
+    to isinstance checks for subclasses of the supported types.
+
     Args:
         data (str|dict|tuple|list): Single data entry.
 
@@ -189,53 +358,161 @@ def is_valid_data_entry(data):
         bool: True if entry is valid, False otherwise.
     """
 
+    validator = _ENTRY_VALIDATORS.get(type(data))
+    if validator is not None:
+        return validator(data)
+
     if isinstance(data, str):
-        if data[:3] == "ChI":
-            print(f"Wrongly formatted PlaceID for {data}. Each Place ID string must be prepended with 'place_id:'")
-            return False
-        else:
-            return bool(data.strip())  # returns False when string is empty or just consist of empty data
+        return _validate_str_entry(data)
     elif isinstance(data, dict):
         return is_valid_coordinate_dict(data)
     elif isinstance(data, (list, tuple)):
-        if len(data) == 2 and is_valid_coordinate_pair(data):
-            return True
-        else:
-            print(f"Input {data} is not a valid coordinate pair")
-            return False
+        return _validate_seq_entry(data)
     else:
-        print(f"Input {data} is not a valid data entry: {type(data).__name__}")
+        logger.debug("Input %s is not a valid data entry: %s", data, type(data).__name__)
+        return False
+
+
+def _validate_query_sequence(input_data):
+    """
+    Validate a list or tuple of location entries.
+
+    Args:
+        input_data (list|tuple): Location input data.
+
+    Returns:
+        bool: True if valid, False otherwise.
+    """
+
+    if len(input_data) == 0:
+        logger.debug("Input %s is empty: %s", input_data, len(input_data))
         return False
 
+    if type(input_data[0]) in (tuple, list) and len(input_data[0]) == 2:
+        coordinate_array = convert_pairs_to_array(input_data)
+        if coordinate_array is not None:
+            return bool(validate_coordinate_array(coordinate_array))
+
+    validate_entry = is_valid_data_entry
+    return all(validate_entry(item) for item in input_data)
+
 
 def is_valid_distance_matrix_query(input_data):
     """
     Validate the structure and contents of origin or destination data.
 
+    Dispatches on the exact input type; subclasses of the supported types
+    fall back to isinstance checks.
+
     Args:
         input_data (str|dict|list|tuple): Location input data.
 
     Returns:
         bool: True if valid, False otherwise.
     """
-    valid_types = (str, list, tuple, dict)
-
-    if isinstance(input_data, valid_types):
-        if isinstance(input_data, (list, tuple)):
-            if isinstance(input_data, tuple) and len(input_data) == 2 and is_valid_coordinate_pair(input_data):
-                return True  # coordinate pair
-            elif len(input_data) == 0:
-                print(f"Input {input_data} is empty: {len(input_data)}")
+
+    input_type = type(input_data)
+
+    if input_type is list:
+        return _validate_query_sequence(input_data)
+    if input_type is tuple:
+        if len(input_data) == 2 and is_valid_coordinate_pair(input_data):
+            return True  # coordinate pair
+        return _validate_query_sequence(input_data)
+    if input_type is dict:
+        return is_valid_coordinate_dict(input_data)
+    if input_type is str:
+        return is_valid_data_entry(input_data)
+
+    if isinstance(input_data, tuple):
+        if len(input_data) == 2 and is_valid_coordinate_pair(input_data):
+            return True
+        return _validate_query_sequence(input_data)
+    if isinstance(input_data, list):
+        return _validate_query_sequence(input_data)
+    if isinstance(input_data, dict):
+        return is_valid_coordinate_dict(input_data)
+    if isinstance(input_data, str):
+        return is_valid_data_entry(input_data)
+
+    logger.debug("Input %s is not a valid data entry: %s", input_data, type(input_data).__name__)
+    return False
+
+
+def convert_pairs_to_array(input_data):
+    """
+    Try to convert a list of coordinate pairs into a numeric NumPy array.
+
+    Used as a bulk fast path: when every entry is a (lat, lng) pair of
+    numbers (or numeric strings), the whole batch can be validated in one
+    C-level pass instead of per-element Python dispatch.
+
+    Args:
+        input_data (list): List of list/tuple coordinate pairs.
+
+    Returns:
+        np.ndarray | None: Array of shape (N, 2), or None if the input is
+                           not uniformly numeric.
+    """
+
+    try:
+        coordinate_array = np.ascontiguousarray(input_data, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+
+    if coordinate_array.ndim == 2 and coordinate_array.shape[1] == 2:
+        return coordinate_array
+    return None
+
+
+if njit is not None:
+    @njit("boolean(float64[:, ::1])", cache=True, boundscheck=False, error_model="numpy")
+    def validate_coordinate_array(coordinate_array):
+        """
+        Check that every (lat, lng) row is non-NaN and within valid ranges.
+
+        Compiled with numba in nopython mode; cache=True persists the
+        machine code across runs. The explicit signature compiles at import
+        time and skips the dispatcher's per-call type inference; the ::1
+        layout requires C-contiguous input, which convert_pairs_to_array
+        guarantees.
+
+        Args:
+            coordinate_array (np.ndarray): Array of shape (N, 2) with float64 values.
+
+        Returns:
+            bool: True if all rows are valid coordinates, False otherwise.
+        """
+
+        if coordinate_array.shape[1] != 2:
+            return False
+        for index in range(coordinate_array.shape[0]):
+            lat = coordinate_array[index, 0]
+            lng = coordinate_array[index, 1]
+            if np.isnan(lat) or np.isnan(lng):
                 return False
-            else:
-                return all(is_valid_data_entry(item) for item in input_data)
-        elif isinstance(input_data, dict):
-            return is_valid_coordinate_dict(input_data)
-        else:
-            return is_valid_data_entry(input_data)
-    else:
-        print(f"Input {input_data} is not a valid data entry: {type(input_data).__name__}")
-        return False
+            if lat < -90.0 or lat > 90.0 or lng < -180.0 or lng > 180.0:
+                return False
+        return True
+else:
+    def validate_coordinate_array(coordinate_array):
+        """
+        Check that every (lat, lng) row is non-NaN and within valid ranges.
+
+        Pure NumPy fallback used when numba is not installed.
+
+        Args:
+            coordinate_array (np.ndarray): Array of shape (N, 2) with float64 values.
+
+        Returns:
+            bool: True if all rows are valid coordinates, False otherwise.
+        """
+
+        if coordinate_array.shape[1] != 2:
+            return False
+        lat = coordinate_array[:, 0]
+        lng = coordinate_array[:, 1]
+        return bool(np.all((lat >= -90.0) & (lat <= 90.0) & (lng >= -180.0) & (lng <= 180.0)))
 
 
 def convert_data_to_list(data):
@@ -252,12 +529,28 @@ def convert_data_to_list(data):
         TypeError: If data is not convertible to list.
     """
 
+    data_type = type(data)
+    if data_type is list:
+        return data
+    if data_type is tuple:
+        return list(data)
+    if data_type is str:
+        return [data]
+
     if isinstance(data, list):
-        data = data
+        return data
     elif isinstance(data, tuple):
-        data = list(data)
+        return list(data)
     elif isinstance(data, str):
-        data = [data]
+        return [data]
     else:
         raise TypeError(f"Invalid data type: {type(data).__name__}")
-    return data
+
+
+if njit is not None:
+    try:
+        # Warm up the JIT validator at import time so the first real request
+        # does not pay the compile (or cache-load) latency.
+        validate_coordinate_array(np.zeros((1, 2), dtype=np.float64))
+    except Exception:
+        pass